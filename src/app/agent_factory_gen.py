@@ -2,11 +2,22 @@
 Tier-3 agent factory interface for Anki LLM Assistant.
 
 This file provides factory functions that call Tier-2 business logic.
+Agents are cached per (model_name, temperature), so repeated calls reuse
+the already-built agent instead of reconstructing it.
 """
 
+from functools import lru_cache
+
 from src.core.agent.agent_factory import AgentFactory
 
 
+@lru_cache(maxsize=1)
+def _get_factory() -> AgentFactory:
+    """Create the Tier-2 factory once and share it across calls"""
+    return AgentFactory()
+
+
+@lru_cache(maxsize=8)
 def create_anki_agent(model_name: str = None, temperature: float = None):
     """
     Create and configure the Anki LLM agent.
@@ -16,13 +27,10 @@ def create_anki_agent(model_name: str = None, temperature: float = None):
         temperature: Model temperature (defaults to config)
     
     Returns:
-        Configured LangChain agent
+        Configured LangChain agent (shared between calls with the same arguments)
     """
-    # Create factory instance (Tier-2)
-    factory = AgentFactory()
-    
     # Create agent using factory (Tier-2 business logic)
-    return factory.create_anki_agent(
+    return _get_factory().create_anki_agent(
         model_name=model_name,
         temperature=temperature
     )
@@ -39,11 +47,7 @@ def create_anki_agent_with_config(model_name: str, temperature: float):
     Returns:
         Configured LangChain agent
     """
-    factory = AgentFactory()
-    return factory.create_anki_agent(
-        model_name=model_name,
-        temperature=temperature
-    )
+    return create_anki_agent(model_name=model_name, temperature=temperature)
 
 
 # Convenience functions for common configurations
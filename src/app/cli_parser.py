@@ -5,16 +5,19 @@ This module handles loading the CLI specification from YAML and building
 the argparse parser from that specification.
 """
 
-import yaml
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
+from src.core.configs.yaml_loader import load_yaml
 
+_CLI_SPEC_PATH = Path(__file__).resolve().parents[2] / "specs" / "cli.yaml"
+
+
+@lru_cache(maxsize=1)
 def load_cli_spec():
-    """Load CLI specification from specs/cli.yaml"""
-    spec_path = Path(__file__).parent.parent.parent / "specs" / "cli.yaml"
-    with open(spec_path, "r") as f:
-        return yaml.safe_load(f)
+    """Load CLI specification from specs/cli.yaml (cached; do not mutate the result)"""
+    return load_yaml(_CLI_SPEC_PATH)
 
 
 def build_parser_from_spec(spec):
@@ -5,9 +5,17 @@ Tier-3 generated interface for anki_list_cards tool.
 This file contains tool decorators that call Tier-2 business logic.
 """
 
+from functools import cache
+
 from langchain.tools import tool
-from src.core.dependencies import get_dependency_container
-from src.core.generated.models import CardListInput
+from src.core.generated.models import CardListInput_ADAPTER
+
+
+@cache
+def _container_getter():
+    """Import the container accessor on first use so loading the tool doesn't build the Tier-2 graph"""
+    from src.core.dependencies import get_dependency_container
+    return get_dependency_container
 
 
 @tool
@@ -26,14 +34,10 @@ def anki_list_cards(input_data: str):
         List of cards from the specified deck
     """
     # NO BUSINESS LOGIC - just calls Tier-2
-    import json
-    
-    deps = get_dependency_container()
-    
-    # Parse JSON string and create Pydantic model instance
-    input_dict = json.loads(input_data)
-    input_model = CardListInput(**input_dict)
+    # Parse and validate the JSON string in one pydantic-core pass
+    input_model = CardListInput_ADAPTER.validate_json(input_data)
     
-    result = deps.cards_tool.list_cards(input_model)
-    # Convert Pydantic model to dict for LangChain compatibility
-    return result.model_dump()
+    # Resolved per call (a cached lookup) so cache_clear() on the container takes effect
+    result = _container_getter()().cards_tool.list_cards(input_model)
+    # Serialize straight to JSON - LangChain passes string observations through as-is
+    return result.model_dump_json()
@@ -5,9 +5,17 @@ Tier-3 generated interface for anki_list_decks tool.
 This file contains tool decorators that call Tier-2 business logic.
 """
 
+from functools import cache
+
 from langchain.tools import tool
-from src.core.dependencies import get_dependency_container
-from src.core.generated.models import DeckListInput
+from src.core.generated.models import DeckListInput_ADAPTER
+
+
+@cache
+def _container_getter():
+    """Import the container accessor on first use so loading the tool doesn't build the Tier-2 graph"""
+    from src.core.dependencies import get_dependency_container
+    return get_dependency_container
 
 
 @tool
@@ -25,14 +33,10 @@ def anki_list_decks(input_data: str):
         List of decks with metadata
     """
     # NO BUSINESS LOGIC - just calls Tier-2
-    import json
-    
-    deps = get_dependency_container()
-    
-    # Parse JSON string and create Pydantic model instance
-    input_dict = json.loads(input_data)
-    input_model = DeckListInput(**input_dict)
+    # Parse and validate the JSON string in one pydantic-core pass
+    input_model = DeckListInput_ADAPTER.validate_json(input_data)
     
-    result = deps.decks_tool.list_decks(input_model)
-    # Convert Pydantic model to dict for LangChain compatibility
-    return result.model_dump()
+    # Resolved per call (a cached lookup) so cache_clear() on the container takes effect
+    result = _container_getter()().decks_tool.list_decks(input_model)
+    # Serialize straight to JSON - LangChain passes string observations through as-is
+    return result.model_dump_json()
@@ -3,40 +3,34 @@ GENERATED – DO NOT EDIT
 
 Tier-3 tool registration for Anki LLM Assistant.
 This file registers decorated tools with the tool registry.
+Tools and their input schemas are resolved from Tier-1 at generation time,
+so no spec files are read at runtime.
 """
 
-import yaml
-from pathlib import Path
 from .anki_list_decks_gen import anki_list_decks
 from .anki_list_cards_gen import anki_list_cards
 
+# Input schemas inlined from specs/schemas
+_ANKI_LIST_DECKS_SCHEMA = {'title': 'DeckListInput',
+ 'type': 'object',
+ 'properties': {'limit': {'type': 'integer',
+                          'description': 'Maximum number of decks to return',
+                          'minimum': 1,
+                          'maximum': 100}},
+ 'required': ['limit']}
+_ANKI_LIST_CARDS_SCHEMA = {'title': 'CardListInput',
+ 'type': 'object',
+ 'properties': {'deck': {'type': 'string',
+                         'description': 'Name of the deck to retrieve cards from',
+                         'minLength': 1},
+                'limit': {'type': 'integer',
+                          'description': 'Maximum number of cards to return',
+                          'minimum': 1,
+                          'maximum': 100}},
+ 'required': ['deck', 'limit']}
+
 
 def register_generated_tools(registry):
     """Register all Tier-3 decorated tools with the registry"""
-
-    # Load tool specifications from Tier-1
-    project_root = Path(__file__).parent.parent.parent.parent
-    tools_spec_path = project_root / "specs" / "tools.yaml"
-
-    if not tools_spec_path.exists():
-        print(f"⚠️  Tools specification not found: {tools_spec_path}")
-        return
-
-    with open(tools_spec_path, 'r') as f:
-        tools_spec = yaml.safe_load(f)
-
-    # Tool mapping: name -> function
-    tools = {
-        "anki_list_decks": anki_list_decks,
-        "anki_list_cards": anki_list_cards,
-    }
-
-    # Register only tools specified in Tier-1
-    available_tools = tools_spec.get('tools', {}).keys()
-    for name, func in tools.items():
-        if name in available_tools:
-            registry.register_tool(
-                name=name,
-                tool_func=func,
-                schema=None  # Schema validation handled by Pydantic models
-            )
+    registry.register_tool("anki_list_decks", anki_list_decks, schema=_ANKI_LIST_DECKS_SCHEMA)
+    registry.register_tool("anki_list_cards", anki_list_cards, schema=_ANKI_LIST_CARDS_SCHEMA)
@@ -6,12 +6,13 @@ a clean interface for accessing runtime settings.
 """
 
 import os
-import yaml
 import pathlib
 from dataclasses import dataclass
 from typing import Optional
 from dotenv import load_dotenv
 
+from .yaml_loader import load_yaml
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -85,8 +86,7 @@ class ConfigLoader:
         if not impl_path.exists():
             raise FileNotFoundError(f"Implementation config not found: {impl_path}")
         
-        with open(impl_path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(impl_path)
         
         runtime_data = data.get("runtime", {})
         
@@ -106,8 +106,7 @@ class ConfigLoader:
         if not impl_path.exists():
             raise FileNotFoundError(f"Implementation config not found: {impl_path}")
         
-        with open(impl_path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(impl_path)
         
         adapters_data = data.get("adapters", {})
         
@@ -128,8 +127,7 @@ class ConfigLoader:
         if not invariants_path.exists():
             raise FileNotFoundError(f"Invariants config not found: {invariants_path}")
         
-        with open(invariants_path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(invariants_path)
         
         inv_data = data.get("inv", {})
         
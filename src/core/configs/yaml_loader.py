@@ -0,0 +1,18 @@
+"""
+YAML loading helper for Anki LLM Assistant.
+
+Uses the libyaml-backed CSafeLoader when PyYAML was built with it and falls
+back to the pure-Python SafeLoader otherwise.
+"""
+
+import pathlib
+
+import yaml
+
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(path: str | pathlib.Path):
+    """Parse a YAML file with the fastest available safe loader"""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_LOADER)
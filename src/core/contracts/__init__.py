@@ -3,24 +3,43 @@ Core contracts and validation models for Anki LLM Assistant.
 
 This package contains the business logic for data validation,
 message contracts, and response formatting rules.
+
+Names are re-exported lazily (PEP 562) so importing the package does not
+build the Pydantic models until one of them is actually used.
 """
 
-from src.core.generated.models import (
-    Deck,
-    DeckList,
-    Card,
-    CardList,
-    CardListInput,
-    DeckListInput
-)
-from src.core.validators.reply_validator import validate_reply
+import importlib
+
+_LAZY = {
+    "Deck": ("src.core.generated.models", "Deck"),
+    "DeckList": ("src.core.generated.models", "DeckList"),
+    "Card": ("src.core.generated.models", "Card"),
+    "CardList": ("src.core.generated.models", "CardList"),
+    "CardListInput": ("src.core.generated.models", "CardListInput"),
+    "DeckListInput": ("src.core.generated.models", "DeckListInput"),
+    "validate_reply": ("src.core.validators.reply_validator", "validate_reply"),
+}
 
 __all__ = [
     "Deck",
-    "DeckList", 
+    "DeckList",
     "Card",
     "CardList",
     "CardListInput",
     "DeckListInput",
     "validate_reply"
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        # Cache on the module so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
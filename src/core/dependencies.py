@@ -5,90 +5,117 @@ This module creates and manages all the dependencies needed by the system,
 ensuring proper initialization and dependency injection.
 """
 
+from functools import lru_cache
+
 from src.core.configs.config import load_config
 from src.core.services.anki_service import MockAnkiService, AnkiConnectService
 from src.core.validators.input_validator import InputValidator
 from src.core.validators.invariant_checker import InvariantChecker
-from src.core.services.response_formatter import ResponseFormatter
 from src.core.tools.decks_tool import DecksTool
 from src.core.tools.cards_tool import CardsTool
 from src.core.tools.tool_registry import ToolRegistry
 
 
+class _SlotCachedProperty:
+    """cached_property for slotted classes: caches the value in the "_<name>" slot"""
+    
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+    
+    def __set_name__(self, owner, name):
+        self.slot_name = f"_{name}"
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot_name)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot_name, value)
+            return value
+
+
 class DependencyContainer:
-    """Container for managing all system dependencies"""
+    """Container for managing all system dependencies
+
+    Everything except the config is built lazily on first access, so callers
+    that only need part of the graph do not pay for the rest.
+    """
+    
+    __slots__ = (
+        "config",
+        "_anki_service",
+        "_input_validator",
+        "_invariant_checker",
+        "_decks_tool",
+        "_cards_tool",
+        "_tool_registry",
+    )
     
     def __init__(self):
         self.config = load_config()
-        self._create_services()
-        self._create_tools()
-        self._create_tool_registry()
     
-    def _create_services(self):
-        """Create all service instances"""
+    @_SlotCachedProperty
+    def anki_service(self):
+        """Anki service selected by the configured mode"""
         # Get mode from config (environment variable controlled)
         anki_mode = self.config.adapters.anki_mode
         
         if anki_mode == "anki_connect":
             # Use real AnkiConnect service
-            self.anki_service = AnkiConnectService(anki_url=self.config.adapters.anki_url)
+            return AnkiConnectService(anki_url=self.config.adapters.anki_url)
         elif anki_mode == "mock":
             # Use mock service for testing/development
-            self.anki_service = MockAnkiService()
+            return MockAnkiService()
         else:
             raise ValueError(f"Invalid Anki mode: {anki_mode}. Use 'mock' or 'anki_connect'")
-
-        self.response_formatter = ResponseFormatter()
     
-    def _create_validators(self):
-        """Create all validator instances"""
-        self.input_validator = InputValidator()
-        self.invariant_checker = InvariantChecker()
+    @_SlotCachedProperty
+    def input_validator(self) -> InputValidator:
+        return InputValidator()
     
-    def _create_tools(self):
-        """Create all tool instances with proper dependencies"""
-        # Create validators first
-        self._create_validators()
-        
-        # Create tools with dependencies
-        self.decks_tool = DecksTool(
+    @_SlotCachedProperty
+    def invariant_checker(self) -> InvariantChecker:
+        return InvariantChecker()
+    
+    @_SlotCachedProperty
+    def decks_tool(self) -> DecksTool:
+        return DecksTool(
             anki_service=self.anki_service,
             validator=self.input_validator,
             invariant_checker=self.invariant_checker,
-            response_formatter=self.response_formatter,
         )
-        
-        self.cards_tool = CardsTool(
+    
+    @_SlotCachedProperty
+    def cards_tool(self) -> CardsTool:
+        return CardsTool(
             anki_service=self.anki_service,
             validator=self.input_validator,
             invariant_checker=self.invariant_checker,
-            response_formatter=self.response_formatter,
         )
     
-    def _create_tool_registry(self):
-        """Create and populate the tool registry"""
-        self.tool_registry = ToolRegistry()
-        self.tool_registry.register_tool("anki_list_decks", self.decks_tool.list_decks)
-        self.tool_registry.register_tool("anki_list_cards", self.cards_tool.list_cards)
-
-
-# Global dependency container instance
-_dependency_container = None
+    @_SlotCachedProperty
+    def tool_registry(self) -> ToolRegistry:
+        """Tool registry populated with the Tier-2 tools"""
+        registry = ToolRegistry()
+        registry.register_tool("anki_list_decks", self.decks_tool.list_decks)
+        registry.register_tool("anki_list_cards", self.cards_tool.list_cards)
+        return registry
 
 
+@lru_cache(maxsize=1)
 def get_dependency_container() -> DependencyContainer:
     """Get or create the global dependency container"""
-    global _dependency_container
-    if _dependency_container is None:
-        _dependency_container = DependencyContainer()
-    return _dependency_container
+    return DependencyContainer()
 
 
 def get_tool_registry() -> ToolRegistry:
     """Get the tool registry from the dependency container"""
-    return get_dependency_container().get_tool_registry()
+    return get_dependency_container().tool_registry
 
 
 def get_config():
     """Get the configuration from the dependency container"""
-    return get_dependency_container().get_config()
+    return get_dependency_container().config
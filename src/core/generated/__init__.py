@@ -1,4 +1,4 @@
 # GENERATED - DO NOT EDIT
-from .models import Card, DeckList, CardList, CardListInput, DeckListInput, Deck
+from .models import Card, CardList, CardListInput, Deck, DeckList, DeckListInput, Card_ADAPTER, CardList_ADAPTER, CardListInput_ADAPTER, Deck_ADAPTER, DeckList_ADAPTER, DeckListInput_ADAPTER, Card_LIST_ADAPTER, Deck_LIST_ADAPTER
 
-__all__ = ['Card', 'DeckList', 'CardList', 'CardListInput', 'DeckListInput', 'Deck']
+__all__ = ['Card', 'CardList', 'CardListInput', 'Deck', 'DeckList', 'DeckListInput', 'Card_ADAPTER', 'CardList_ADAPTER', 'CardListInput_ADAPTER', 'Deck_ADAPTER', 'DeckList_ADAPTER', 'DeckListInput_ADAPTER', 'Card_LIST_ADAPTER', 'Deck_LIST_ADAPTER']
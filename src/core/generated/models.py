@@ -1,19 +1,19 @@
 # GENERATED - DO NOT EDIT
 from __future__ import annotations
-from pydantic import BaseModel
-from typing import Optional, List, Literal, Any
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Optional, List, Literal
 
 class Card(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     question: str
     answer: str
     deck: str
 
-class DeckList(BaseModel):
-    kind: Literal['deck_list']
-    decks: List['Deck']
-
 class CardList(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     kind: Literal['card_list']
     deck: str
     cards: List['Card']
@@ -22,14 +22,37 @@ class CardList(BaseModel):
     has_more: bool
 
 class CardListInput(BaseModel):
-    deck: str
-    limit: int
+    model_config = ConfigDict(frozen=True)
 
-class DeckListInput(BaseModel):
+    deck: str
     limit: int
 
 class Deck(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     note_count: int
     card_count: Optional[int] = 0
 
+class DeckList(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal['deck_list']
+    decks: List['Deck']
+
+class DeckListInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    limit: int
+
+# Validators built once per process and shared by all callers
+Card_ADAPTER = TypeAdapter(Card)
+CardList_ADAPTER = TypeAdapter(CardList)
+CardListInput_ADAPTER = TypeAdapter(CardListInput)
+Deck_ADAPTER = TypeAdapter(Deck)
+DeckList_ADAPTER = TypeAdapter(DeckList)
+DeckListInput_ADAPTER = TypeAdapter(DeckListInput)
+
+# Batch validators for array item models
+Card_LIST_ADAPTER = TypeAdapter(List[Card])
+Deck_LIST_ADAPTER = TypeAdapter(List[Deck])
@@ -5,16 +5,18 @@ This module loads prompt templates from Tier-1 (specs) for use in Tier-2 code.
 """
 
 import pathlib
+from functools import lru_cache
 
+# Resolved once at import - specs is in project root
+_PROMPTS_DIR = pathlib.Path(__file__).resolve().parents[3] / "specs" / "prompts"
 
+
+@lru_cache(maxsize=None)
 def load_prompt_template(prompt_name: str) -> str:
     """Load a prompt template from the specs directory"""
-    project_root = pathlib.Path(__file__).parent.parent.parent.parent
-    prompts_dir = project_root / "specs" / "prompts"
-    prompt_path = prompts_dir / f"{prompt_name}.prompt"
+    prompt_path = _PROMPTS_DIR / f"{prompt_name}.prompt"
     
     if not prompt_path.exists():
         raise FileNotFoundError(f"Prompt template not found: {prompt_path}")
     
-    with open(prompt_path, 'r') as f:
-        return f.read().strip()
+    return prompt_path.read_text(encoding="utf-8").strip()
@@ -1,23 +1,42 @@
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
+
+import requests
+from requests.adapters import HTTPAdapter
+
 from ..contracts import Deck, Card
-from ..generated.models import CardList
+from ..generated.models import CardList, Card_LIST_ADAPTER, Deck_LIST_ADAPTER
+
+# AnkiConnect API version used for every request
+_ANKI_CONNECT_VERSION = 6
+
+# Static payloads are built once and shared across calls
+_DECK_NAMES_PAYLOAD = {"action": "deckNames", "version": _ANKI_CONNECT_VERSION}
+
 
+# Shared keep-alive session so consecutive AnkiConnect calls reuse one connection
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
-class AnkiService(ABC):
-    """Abstract base class for Anki data access services"""
+
+def _payload(action: str, **params) -> dict:
+    """Build an AnkiConnect request payload"""
+    return {"action": action, "version": _ANKI_CONNECT_VERSION, "params": params}
+
+
+@runtime_checkable
+class AnkiService(Protocol):
+    """Interface for Anki data access services (structural, no base class needed)"""
     
-    @abstractmethod
     def get_decks(self, limit: int) -> list[Deck]:
         """Retrieve available Anki decks with metadata"""
-        pass
+        ...
     
-    @abstractmethod
-    def get_cards(self, deck: str, limit: int) -> list[Card]:
+    def get_cards(self, deck: str, limit: int) -> CardList:
         """Retrieve cards from a specific Anki deck"""
-        pass
+        ...
 
 
-class MockAnkiService(AnkiService):
+class MockAnkiService:
     """Mock Anki service for testing and development"""
     
     def get_decks(self, limit: int) -> list[Deck]:
@@ -25,17 +44,19 @@ class MockAnkiService(AnkiService):
         return raw_decks[:limit]
     
     def _fetch_decks_from_anki(self) -> list[Deck]:
+        # Trusted literals - skip Pydantic validation
         return [
-            Deck(name="French::A1", note_count=312, card_count=0),
-            Deck(name="EVP C1/C2", note_count=10452, card_count=0),
-            Deck(name="Default", note_count=0, card_count=0),
-            Deck(name="English Personal", note_count=394, card_count=0),
+            Deck.model_construct(name="French::A1", note_count=312, card_count=0),
+            Deck.model_construct(name="EVP C1/C2", note_count=10452, card_count=0),
+            Deck.model_construct(name="Default", note_count=0, card_count=0),
+            Deck.model_construct(name="English Personal", note_count=394, card_count=0),
         ]
     
     def get_cards(self, deck: str, limit: int) -> CardList:
         raw_cards = self._fetch_cards_from_anki(deck)
-        cards = [Card(id=i, question=f"Question {i}", answer=f"Answer {i}", deck=deck) for i in raw_cards[:limit]]
-        return CardList(
+        # Data is built here, so skip Pydantic validation
+        cards = [Card.model_construct(id=i, question=f"Question {i}", answer=f"Answer {i}", deck=deck) for i in raw_cards[:limit]]
+        return CardList.model_construct(
             kind="card_list",
             deck=deck,
             cards=cards,
@@ -48,7 +69,7 @@ class MockAnkiService(AnkiService):
         return list(range(1, 50))
 
 
-class AnkiConnectService(AnkiService):
+class AnkiConnectService:
     """Real Anki service using AnkiConnect API"""
     
     def __init__(self, anki_url: str = "http://127.0.0.1:8765"):
@@ -56,15 +77,8 @@ class AnkiConnectService(AnkiService):
     
     def get_decks(self, limit: int) -> list[Deck]:
         """Retrieve available Anki decks via AnkiConnect"""
-        import requests
-        
-        payload = {
-            "action": "deckNames",
-            "version": 6
-        }
-        
         try:
-            response = requests.post(self.anki_url, json=payload, timeout=5)
+            response = _session.post(self.anki_url, json=_DECK_NAMES_PAYLOAD, timeout=5)
             result = response.json()
             
             if result.get("error") is not None:
@@ -74,90 +88,85 @@ class AnkiConnectService(AnkiService):
             if not deck_names:
                 raise Exception("No decks found in Anki collection")
             
-            decks = []
+            deck_names = deck_names[:limit]
             
-            for deck_name in deck_names[:limit]:
-                try:
-                    stats = self._get_deck_stats(deck_name)
-                    decks.append(Deck(
-                        name=deck_name,
-                        note_count=stats.get("note_count", 0),
-                        card_count=stats.get("card_count", 0)
-                    ))
-                except Exception as e:
-                    # Add deck with default stats if we can't get them
-                    decks.append(Deck(
-                        name=deck_name,
-                        note_count=0,
-                        card_count=0
-                    ))
+            # Fetch stats for all decks in a single round-trip
+            decks_stats = self._get_deck_stats_batch(deck_names)
             
-            return decks
+            # Deck data comes from AnkiConnect, so validate the whole batch in one call
+            return Deck_LIST_ADAPTER.validate_python([
+                {
+                    "name": deck_name,
+                    "note_count": stats.get("note_count", 0),
+                    "card_count": stats.get("card_count", 0)
+                }
+                for deck_name, stats in zip(deck_names, decks_stats, strict=True)
+            ])
             
         except requests.exceptions.RequestException as e:
             raise Exception(f"Failed to connect to Anki: {e}")
         except Exception as e:
             raise Exception(f"Error retrieving decks: {e}")
     
-    def _get_deck_stats(self, deck_name: str) -> dict:
-        """Get deck statistics using getDeckStats"""
-        import requests
-        
-        payload = {
-            "action": "getDeckStats",
-            "version": 6,
-            "params": {"decks": [deck_name]}
-        }
+    def _get_deck_stats_batch(self, deck_names: list[str]) -> list[dict]:
+        """Get statistics for several decks with one AnkiConnect "multi" call"""
+        payload = _payload("multi", actions=[
+            _payload("getDeckStats", decks=[deck_name]) for deck_name in deck_names
+        ])
         
         try:
-            response = requests.post(self.anki_url, json=payload, timeout=5)
+            response = _session.post(self.anki_url, json=payload, timeout=5)
             result = response.json()
             
             if result.get("error") is not None:
                 raise Exception(f"AnkiConnect error: {result['error']}")
             
-            stats = result.get("result", {})
-            
-            # Handle the actual AnkiConnect response structure
-            note_count = 0
-            card_count = 0
+            action_results = result.get("result") or []
+            if len(action_results) != len(deck_names):
+                # Results can't be matched to decks, so every deck gets default stats
+                return [{"note_count": 0, "card_count": 0} for _ in deck_names]
             
-            if stats:
-                # Find the deck stats (there should be only one entry)
-                deck_stats = list(stats.values())[0] if stats else {}
-                
-                if deck_stats:
-                    # Extract counts from the deck stats
-                    card_count = deck_stats.get("total_in_deck", 0)
-                    # For now, assume note_count equals card_count (this is usually true)
-                    note_count = card_count
+            decks_stats = []
+            for action_result in action_results:
+                # Decks whose stats can't be read get default stats
+                if action_result.get("error") is not None:
+                    decks_stats.append({"note_count": 0, "card_count": 0})
+                else:
+                    decks_stats.append(self._parse_deck_stats(action_result.get("result", {})))
             
-            return {
-                "note_count": note_count,
-                "card_count": card_count
-            }
+            return decks_stats
             
         except Exception as e:
-            return {
-                "note_count": 0,
-                "card_count": 0
-            }
+            return [{"note_count": 0, "card_count": 0} for _ in deck_names]
+    
+    def _parse_deck_stats(self, stats: dict) -> dict:
+        """Extract note/card counts from a getDeckStats result"""
+        # Handle the actual AnkiConnect response structure
+        note_count = 0
+        card_count = 0
+        
+        if stats:
+            # Find the deck stats (there should be only one entry)
+            deck_stats = next(iter(stats.values()), {})
+            
+            if deck_stats:
+                # Extract counts from the deck stats
+                card_count = deck_stats.get("total_in_deck", 0)
+                # For now, assume note_count equals card_count (this is usually true)
+                note_count = card_count
+        
+        return {
+            "note_count": note_count,
+            "card_count": card_count
+        }
     
     def get_cards(self, deck: str, limit: int) -> CardList:
         """Retrieve cards from a specific Anki deck via AnkiConnect"""
-        import requests
-        
         # Get card IDs for the deck
-        payload = {
-            "action": "findCards",
-            "version": 6,
-            "params": {
-                "query": f"deck:{deck}"
-            }
-        }
+        payload = _payload("findCards", query=f"deck:{deck}")
         
         try:
-            response = requests.post(self.anki_url, json=payload, timeout=5)
+            response = _session.post(self.anki_url, json=payload, timeout=5)
             response.raise_for_status()
             result = response.json()
             
@@ -184,16 +193,18 @@ class AnkiConnectService(AnkiService):
             # Batch get info for limited cards
             cards_info = self._get_cards_info_batch(limited_card_ids)
             
-            cards = []
-            for i, card_info in enumerate(cards_info):
-                cards.append(Card(
-                    id=str(limited_card_ids[i]),
-                    question=card_info.get("question", ""),
-                    answer=card_info.get("answer", ""),
-                    deck=deck
-                ))
+            # Card data comes from AnkiConnect, so validate the whole batch in one call
+            cards = Card_LIST_ADAPTER.validate_python([
+                {
+                    "id": card_id,
+                    "question": card_info.get("question", ""),
+                    "answer": card_info.get("answer", ""),
+                    "deck": deck
+                }
+                for card_id, card_info in zip(limited_card_ids, cards_info)
+            ])
             
-            return CardList(
+            return CardList.model_construct(
                 kind="card_list",
                 deck=deck,
                 cards=cards,
@@ -209,16 +220,10 @@ class AnkiConnectService(AnkiService):
     
     def _get_cards_info_batch(self, card_ids: list[int]) -> list[dict]:
         """Get card information for multiple cards in a single API call"""
-        import requests
-        
-        payload = {
-            "action": "cardsInfo",
-            "version": 6,
-            "params": {"cards": card_ids}
-        }
+        payload = _payload("cardsInfo", cards=card_ids)
         
         try:
-            response = requests.post(self.anki_url, json=payload, timeout=5)
+            response = _session.post(self.anki_url, json=payload, timeout=5)
             result = response.json()
             
             if result.get("error") is not None:
@@ -227,32 +232,22 @@ class AnkiConnectService(AnkiService):
             cards_data = result.get("result", [])
             cards_info = []
             
+            # Cards of one note type share a field layout, so resolve the
+            # question/answer field names once per layout
+            field_keys_by_layout: dict[tuple[str, ...], tuple[str | None, str | None]] = {}
+            
             for card_data in cards_data:
                 # Extract question and answer from fields
                 fields = card_data.get("fields", {})
                 
-                # Try different possible field names
-                question = ""
-                answer = ""
-                
-                if "Front" in fields:
-                    question = fields["Front"].get("value", "")
-                elif "Question" in fields:
-                    question = fields["Question"].get("value", "")
-                else:
-                    # Fallback: use first field as question
-                    first_field = next(iter(fields.values()), {})
-                    question = first_field.get("value", "")
+                layout = tuple(fields)
+                field_keys = field_keys_by_layout.get(layout)
+                if field_keys is None:
+                    field_keys = field_keys_by_layout[layout] = self._resolve_field_keys(layout)
+                question_key, answer_key = field_keys
                 
-                if "Back" in fields:
-                    answer = fields["Back"].get("value", "")
-                elif "Answer" in fields:
-                    answer = fields["Answer"].get("value", "")
-                else:
-                    # Fallback: use second field as answer if available
-                    field_values = list(fields.values())
-                    if len(field_values) > 1:
-                        answer = field_values[1].get("value", "")
+                question = fields[question_key].get("value", "") if question_key is not None else ""
+                answer = fields[answer_key].get("value", "") if answer_key is not None else ""
                 
                 cards_info.append({
                     "question": question,
@@ -263,4 +258,25 @@ class AnkiConnectService(AnkiService):
             
         except Exception as e:
             # Return default info for all cards if batch call fails
-            return [{"question": f"Card {cid}", "answer": "Information unavailable"} for cid in card_ids]
\ No newline at end of file
+            return [{"question": f"Card {cid}", "answer": "Information unavailable"} for cid in card_ids]
+    
+    def _resolve_field_keys(self, field_names: tuple[str, ...]) -> tuple[str | None, str | None]:
+        """Pick the question and answer field names for a note's field layout"""
+        # Try different possible field names
+        if "Front" in field_names:
+            question_key = "Front"
+        elif "Question" in field_names:
+            question_key = "Question"
+        else:
+            # Fallback: use first field as question
+            question_key = field_names[0] if field_names else None
+        
+        if "Back" in field_names:
+            answer_key = "Back"
+        elif "Answer" in field_names:
+            answer_key = "Answer"
+        else:
+            # Fallback: use second field as answer if available
+            answer_key = field_names[1] if len(field_names) > 1 else None
+        
+        return question_key, answer_key
@@ -11,7 +11,7 @@ class CardsTool:
         anki_service: AnkiService,
         validator: InputValidator,
         invariant_checker: InvariantChecker,
-        response_formatter: ResponseFormatter,
+        response_formatter: ResponseFormatter | None = None,
     ):
         self.anki_service = anki_service
         self.validator = validator
@@ -10,7 +10,7 @@ class DecksTool:
         anki_service: AnkiService,
         validator: InputValidator,
         invariant_checker: InvariantChecker,
-        response_formatter: ResponseFormatter,
+        response_formatter: ResponseFormatter | None = None,
     ):
         self.anki_service = anki_service
         self.validator = validator
@@ -27,5 +27,5 @@ class DecksTool:
         # Business logic: check invariants
         self.invariant_checker.ensure_deck_limit(decks)
         
-        # Business logic: format response
-        return self.response_formatter.format_deck_list(decks)
+        # Business logic: format response (decks come from our own service - skip re-validation)
+        return DeckList.model_construct(kind="deck_list", decks=decks)
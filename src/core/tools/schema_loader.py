@@ -1,14 +1,15 @@
 import json
 import pathlib
+from functools import lru_cache
 from typing import Dict, Any
 
+# Resolved once at import - specs is in project root
+_SPECS_DIR = pathlib.Path(__file__).resolve().parents[3] / "specs"
+
+@lru_cache(maxsize=None)
 def load_schema(schema_path: str) -> Dict[str, Any]:
-    """Load a JSON schema file from the specs directory"""
-    # Convert relative path to absolute path - specs is in project root
-    project_root = pathlib.Path(__file__).parent.parent.parent.parent
-    specs_dir = project_root / "specs"
-    full_path = specs_dir / schema_path
+    """Load a JSON schema file from the specs directory (cached; do not mutate the result)"""
+    full_path = _SPECS_DIR / schema_path
     
     # Load and parse JSON schema
-    with open(full_path, 'r') as f:
-        return json.load(f)
+    return json.loads(full_path.read_bytes())
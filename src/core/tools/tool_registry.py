@@ -1,24 +1,49 @@
+class _ToolEntry:
+    """A registered tool and its (optional) schema"""
+    __slots__ = ("func", "schema")
+
+    def __init__(self, func, schema: dict = None):
+        self.func = func
+        self.schema = schema
+
+
 class ToolRegistry:
+    __slots__ = ("_entries", "_funcs")
+
     def __init__(self):
-        self._tools = {}
-        self._schemas = {}
-    
+        self._entries: dict[str, _ToolEntry] = {}
+        self._funcs = None  # Cached get_tools() result, reset on registration
+
     def register_tool(self, name: str, tool_func, schema: dict = None):
         """Register a tool with its schema (schema can be None for Pydantic model validation)"""
-        self._tools[name] = tool_func
-        self._schemas[name] = schema
-    
+        self._entries[name] = _ToolEntry(tool_func, schema)
+        self._funcs = None
+
     def get_tools(self) -> list:
-        """Get all registered tools"""
-        return list(self._tools.values())
-    
+        """Get all registered tools (shared list; do not mutate)"""
+        if self._funcs is None:
+            self._funcs = [entry.func for entry in self._entries.values()]
+        return self._funcs
+
     def get_tool_schema(self, name: str) -> dict | None:
         """Get schema for a specific tool (returns None if no schema)"""
-        return self._schemas[name]
-    
+        return self._entries[name].schema
+
     def validate_tool_config(self):
         """Ensure all tools match spec requirements"""
         # Validate against your agent.spec.md requirements
-        for name, schema in self._schemas.items():
-            if schema is not None:  # Skip validation for tools without schemas
-                self._validate_tool_against_spec(name, schema)
+        for name, entry in self._entries.items():
+            if entry.schema is not None:  # Skip validation for tools without schemas
+                self._validate_tool_against_spec(name, entry.schema)
+
+    @staticmethod
+    def _validate_tool_against_spec(name: str, schema: dict):
+        """Check that a tool's input schema is a well-formed object schema"""
+        if schema.get("type") != "object":
+            raise ValueError(f"Tool {name}: input schema must have type 'object'")
+        properties = schema.get("properties")
+        if not isinstance(properties, dict) or not properties:
+            raise ValueError(f"Tool {name}: input schema must define properties")
+        missing = [field for field in schema.get("required", []) if field not in properties]
+        if missing:
+            raise ValueError(f"Tool {name}: required fields not in properties: {missing}")
@@ -1,12 +1,12 @@
 
 class InputValidator:
     def validate_deck_limit(self, limit) -> int:
-        # Business rule: type coercion
+        # Business rule: type coercion (only strings are converted)
         if isinstance(limit, str):
             limit = int(limit)
         
         # Business rule: range validation
-        if limit < 1 or limit > 100:
+        if not 1 <= limit <= 100:
             raise ValueError("Limit must be between 1 and 100")
         
         return limit
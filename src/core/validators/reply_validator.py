@@ -5,18 +5,22 @@ This module handles validation of reply payloads against Pydantic models.
 """
 
 from src.core.generated.models import DeckList, CardList
-from typing import Union
+from typing import Annotated, Union
+from pydantic import Field, TypeAdapter, ValidationError
 
-ReplyMessage = Union[DeckList, CardList]
+# Tagged union: pydantic-core dispatches on "kind" instead of trying each model
+ReplyMessage = Annotated[Union[DeckList, CardList], Field(discriminator="kind")]
 
-def validate_reply(payload: dict) -> ReplyMessage:
-    """Validate a reply payload against the appropriate contract."""
+_REPLY_ADAPTER = TypeAdapter(ReplyMessage)
+
+def validate_reply(payload: dict | str | bytes) -> ReplyMessage:
+    """Validate a reply payload against the appropriate contract.
+
+    Raw JSON (str/bytes) is parsed and validated in one pass by pydantic-core.
+    """
     try:
-        if payload.get("kind") == "deck_list":
-            return DeckList(**payload)
-        elif payload.get("kind") == "card_list":
-            return CardList(**payload)
-        else:
-            raise ValueError(f"Unknown message kind: {payload.get('kind')}")
-    except Exception as e:
+        if isinstance(payload, (str, bytes)):
+            return _REPLY_ADAPTER.validate_json(payload)
+        return _REPLY_ADAPTER.validate_python(payload)
+    except ValidationError as e:
         raise ValueError(f"Validation failed: {e}")
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Generate All: Runs the schema and tool generators in one pass
+
+The YAML schemas are parsed once and shared by both generators.
+
+Usage: python src/scripts/generate_all.py
+       or: invoke generate-and-test
+"""
+
+import schema_generator
+import tool_generator
+
+
+def generate_all():
+    """Generate Pydantic models and Tier-3 tool files from one schema parse"""
+    schemas = schema_generator.load_schemas()
+    schema_generator.generate_models(schemas)
+    tool_generator.generate_tools(schemas)
+
+
+if __name__ == "__main__":
+    generate_all()
+    print("\n🎉 Done! Run 'invoke generate-and-test' to verify everything works.")
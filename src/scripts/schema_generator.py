@@ -5,69 +5,131 @@ Schema Generator: Converts YAML schemas to Pydantic models
 Usage: python src/scripts/schema_generator.py
        or: invoke generate-models
 """
+import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
-def generate_models():
-    """Generate Pydantic models from YAML schemas"""
-    specs_dir = Path("specs/schemas")
-    output_file = Path("src/core/generated/models.py")
+# libyaml-backed loader when available (much faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Resolved from this file so the generator works from any working directory
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_SCHEMAS_DIR = _PROJECT_ROOT / "specs" / "schemas"
+_GENERATED_DIR = _PROJECT_ROOT / "src" / "core" / "generated"
+
+def load_schemas(specs_dir: Path = _SCHEMAS_DIR):
+    """Parse every *.schema.yaml in specs_dir, keyed by schema name (e.g. 'card_list')"""
+    schemas = {}
+    # Sorted so the generated output is stable across filesystems
+    for schema_file in sorted(specs_dir.glob("*.schema.yaml")):
+        with open(schema_file, 'rb') as fh:
+            schemas[schema_file.name.removesuffix(".schema.yaml")] = yaml.load(fh, Loader=_YAML_LOADER)
+    return schemas
+
+def generate_models(schemas=None):
+    """Generate Pydantic models from YAML schemas (pass preloaded schemas to skip parsing)"""
+    specs_dir = _SCHEMAS_DIR
+    output_file = _GENERATED_DIR / "models.py"
 
     print("🔧 Generating Pydantic models from YAML schemas...")
 
-    if not specs_dir.exists():
-        print(f"❌ Schema directory not found: {specs_dir}")
-        return
+    if schemas is None:
+        if not specs_dir.exists():
+            print(f"❌ Schema directory not found: {specs_dir}")
+            return
+        schemas = load_schemas(specs_dir)
 
-    # Find schema files
-    schema_files = list(specs_dir.glob("*.schema.yaml"))
-    if not schema_files:
+    if not schemas:
         print(f"❌ No schema files found in {specs_dir}")
         return
 
-    print(f"📝 Found {len(schema_files)} schema files")
+    print(f"📝 Found {len(schemas)} schema files")
 
-    # Generate models from all schema files
+    # Generate models from all schemas
     models = []
-    for schema_file in schema_files:
-        schema = yaml.safe_load(open(schema_file))
-        class_name = schema_file.stem.replace('.schema', '').replace('_', ' ').title().replace(' ', '')
+    for schema_name, schema in schemas.items():
+        class_name = _class_name(schema_name)
         models.append((class_name, schema))
         print(f"   ✅ {class_name}")
 
-    # Write models to file
-    with open(output_file, 'w') as f:
-        f.write("# GENERATED - DO NOT EDIT\n")
-        f.write("from __future__ import annotations\n")
-        f.write("from pydantic import BaseModel\n")
-        f.write("from typing import Optional, List, Literal, Any\n\n")
-
-        # Write all models
-        for class_name, schema in models:
-            f.write(f"class {class_name}(BaseModel):\n")
-            properties = schema.get('properties', {})
-            required = schema.get('required', [])
-
-            for prop_name, prop_schema in properties.items():
-                field_type = _get_type(prop_schema)
-                if prop_name in required:
-                    f.write(f"    {prop_name}: {field_type}\n")
+    # Build the whole module in memory and write it once; the imports go in
+    # last because the oneOf helpers are only imported when a field needs them
+    parts = []
+
+    # Write all models
+    for class_name, schema in models:
+        parts.append(f"class {class_name}(BaseModel):\n")
+        # Contract values are never mutated after validation
+        parts.append("    model_config = ConfigDict(frozen=True)\n\n")
+        properties = schema.get('properties', {})
+        required = schema.get('required', [])
+
+        for prop_name, prop_schema in properties.items():
+            field_type = _get_type(prop_schema)
+            if prop_name in required:
+                parts.append(f"    {prop_name}: {field_type}\n")
+            else:
+                default = prop_schema.get('default')
+                if default is not None:
+                    parts.append(f"    {prop_name}: Optional[{field_type}] = {default}\n")
                 else:
-                    default = prop_schema.get('default')
-                    if default is not None:
-                        f.write(f"    {prop_name}: Optional[{field_type}] = {default}\n")
-                    else:
-                        f.write(f"    {prop_name}: Optional[{field_type}] = None\n")
-            f.write("\n")
+                    parts.append(f"    {prop_name}: Optional[{field_type}] = None\n")
+        parts.append("\n")
+
+    # One adapter per model, emitted after all classes so forward refs resolve
+    parts.append("# Validators built once per process and shared by all callers\n")
+    for class_name, _ in models:
+        parts.append(f"{class_name}_ADAPTER = TypeAdapter({class_name})\n")
+
+    # Whole-list validators for models used as array items, so a batch is one call
+    list_items = _array_item_classes(models)
+    if list_items:
+        parts.append("\n# Batch validators for array item models\n")
+    for class_name in list_items:
+        parts.append(f"{class_name}_LIST_ADAPTER = TypeAdapter(List[{class_name}])\n")
+
+    body = "".join(parts)
+    pydantic_names = ["BaseModel", "ConfigDict"] + _used_names(body, ["Field"]) + ["TypeAdapter"]
+    typing_names = _used_names(body, ["Optional", "List", "Literal", "Any", "Annotated", "Union"])
+    header = "# GENERATED - DO NOT EDIT\nfrom __future__ import annotations\n"
+    header += f"from pydantic import {', '.join(pydantic_names)}\n"
+    if typing_names:
+        header += f"from typing import {', '.join(typing_names)}\n"
+    header += "\n"
+    output_file.write_text(header + body)
 
     # Update __init__.py
     all_models = [name for name, _ in models]
-    with open(Path("src/core/generated/__init__.py"), 'w') as f:
-        f.write("# GENERATED - DO NOT EDIT\n")
-        f.write("from .models import " + ", ".join(all_models) + "\n\n")
-        f.write(f'__all__ = {all_models}\n')
+    all_models += [f"{name}_ADAPTER" for name, _ in models]
+    all_models += [f"{name}_LIST_ADAPTER" for name in list_items]
+    (_GENERATED_DIR / "__init__.py").write_text(
+        "# GENERATED - DO NOT EDIT\n"
+        + "from .models import " + ", ".join(all_models) + "\n\n"
+        + f'__all__ = {all_models}\n'
+    )
+
+    print(f"✅ Generated {len(models)} models in {output_file}")
+
+def _array_item_classes(models):
+    """Sorted class names of models referenced as array items"""
+    names = set()
+    for _, schema in models:
+        for prop_schema in schema.get('properties', {}).values():
+            items = prop_schema.get('items', {}) if prop_schema.get('type') == 'array' else {}
+            if '$ref' in items:
+                names.add(_class_name(Path(items['$ref']).stem))
+    return sorted(names)
+
+@lru_cache(maxsize=None)
+def _class_name(stem):
+    """Convert a schema name or file stem (e.g. 'card_list.schema') to a class name"""
+    return stem.replace('.schema', '').replace('_', ' ').title().replace(' ', '')
+
+def _used_names(source: str, names: list[str]) -> list[str]:
+    """Subset of names that the generated source refers to, in the given order"""
+    return [name for name in names if re.search(rf"\b{name}\b", source)]
 
-    print(f"✅ Generated {len(all_models)} models in {output_file}")
 
 def _get_type(schema):
     """Get Pydantic type from schema"""
@@ -86,12 +148,19 @@ def _get_type(schema):
     elif schema_type == 'array':
         items = schema.get('items', {})
         if '$ref' in items:
-            ref_name = Path(items['$ref']).stem.replace('.schema', '').replace('_', ' ').title().replace(' ', '')
+            ref_name = _class_name(Path(items['$ref']).stem)
             return f"List['{ref_name}']"
         else:
             return f"List[{_get_type(items)}]"
+    elif 'oneOf' in schema:
+        variants = ", ".join(_get_type(option) for option in schema['oneOf'])
+        # Tagged unions let pydantic-core dispatch on the tag instead of trying each variant
+        discriminator = schema.get('discriminator', {}).get('propertyName')
+        if discriminator:
+            return f"Annotated[Union[{variants}], Field(discriminator={discriminator!r})]"
+        return f"Union[{variants}]"
     elif '$ref' in schema:
-        ref_name = Path(schema['$ref']).stem.replace('.schema', '').replace('_', ' ').title().replace(' ', '')
+        ref_name = _class_name(Path(schema['$ref']).stem)
         return f"'{ref_name}'"
 
     return "Any"
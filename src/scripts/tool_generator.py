@@ -7,15 +7,73 @@ Usage: python src/scripts/tool_generator.py
 """
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
+from pprint import pformat
+from string import Template
 from typing import Dict, Any
 
+# libyaml-backed loader when available (scripts run standalone, outside src)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_SCHEMAS_DIR = _PROJECT_ROOT / 'specs' / 'schemas'
 
-def generate_tools():
-    """Generate Tier-3 tool files from YAML specifications"""
-    specs_dir = Path("specs")
+
+# Tier-3 tool wrapper, parsed once at import and rendered per tool
+_TOOL_TEMPLATE = Template('''"""
+GENERATED – DO NOT EDIT
+
+Tier-3 generated interface for ${tool_name} tool.
+This file contains tool decorators that call Tier-2 business logic.
+"""
+
+from functools import cache
+
+from langchain.tools import tool
+from src.core.generated.models import ${input_model_name}_ADAPTER
+
+
+@cache
+def _container_getter():
+    """Import the container accessor on first use so loading the tool doesn't build the Tier-2 graph"""
+    from src.core.dependencies import get_dependency_container
+    return get_dependency_container
+
+
+@tool
+def ${tool_name}(input_data: str):
+    """
+    ${purpose}
+    
+    Expected input parameters:
+        ${arg_docs}
+    
+    Args:
+        input_data: JSON string containing the input parameters
+    
+    Returns:
+        ${output_description}
+    """
+    # NO BUSINESS LOGIC - just calls Tier-2
+    # Parse and validate the JSON string in one pydantic-core pass
+    input_model = ${input_model_name}_ADAPTER.validate_json(input_data)
+    
+    # Resolved per call (a cached lookup) so cache_clear() on the container takes effect
+    result = _container_getter()().${dep_name}.${method_name}(input_model)
+    # Serialize straight to JSON - LangChain passes string observations through as-is
+    return result.model_dump_json()
+''')
+
+
+def generate_tools(schemas=None):
+    """Generate Tier-3 tool files from YAML specifications
+
+    schemas optionally maps schema names to already-parsed schemas; any name
+    missing from it is loaded from specs/schemas.
+    """
+    specs_dir = _PROJECT_ROOT / "specs"
     tools_spec_path = specs_dir / "tools.yaml"
-    gen_dir = Path("src/app/tools")
+    gen_dir = _PROJECT_ROOT / "src" / "app" / "tools"
 
     print("🔧 Generating Tier-3 tool files from YAML specifications...")
 
@@ -24,8 +82,8 @@ def generate_tools():
         return
 
     # Load tool specifications
-    with open(tools_spec_path, 'r') as f:
-        tools_spec = yaml.safe_load(f)
+    with open(tools_spec_path, 'rb') as f:
+        tools_spec = yaml.load(f, Loader=_YAML_LOADER)
 
     tools = tools_spec.get('tools', {})
     if not tools:
@@ -39,19 +97,19 @@ def generate_tools():
 
     # Generate individual tool files
     for tool_name, tool_spec in tools.items():
-        generate_tool_file(tool_name, tool_spec, gen_dir)
+        generate_tool_file(tool_name, tool_spec, gen_dir, schemas)
         print(f"   ✅ {tool_name}")
 
     # Generate __init__.py
     generate_init_file(tools.keys(), gen_dir)
 
     # Generate register_tools.py
-    generate_register_tools(tools.keys(), gen_dir)
+    generate_register_tools(tools, gen_dir, schemas)
 
     print(f"✅ Generated {len(tools)} tool files in {gen_dir}")
 
 
-def generate_tool_file(tool_name: str, tool_spec: Dict[str, Any], gen_dir: Path):
+def generate_tool_file(tool_name: str, tool_spec: Dict[str, Any], gen_dir: Path, schemas=None):
     """Generate a single tool file"""
     
     # Extract tool information
@@ -64,7 +122,7 @@ def generate_tool_file(tool_name: str, tool_spec: Dict[str, Any], gen_dir: Path)
     if not input_schema_name:
         raise ValueError(f"Tool {tool_name} missing input schema")
     
-    input_schema = load_schema(input_schema_name)
+    input_schema = _lookup_schema(input_schema_name, schemas)
     if not input_schema:
         raise ValueError(f"Could not load input schema {input_schema_name} for tool {tool_name}")
     
@@ -91,51 +149,19 @@ def generate_tool_file(tool_name: str, tool_spec: Dict[str, Any], gen_dir: Path)
         dep_name = f"{base_name}_tool"
         method_name = base_name
     
-    # Generate the tool file content
-    content = f'''"""
-GENERATED – DO NOT EDIT
-
-Tier-3 generated interface for {tool_name} tool.
-This file contains tool decorators that call Tier-2 business logic.
-"""
-
-from langchain.tools import tool
-from src.core.dependencies import get_dependency_container
-from src.core.generated.models import {input_model_name}
-
-
-@tool
-def {tool_name}(input_data: str):
-    """
-    {purpose}
-    
-    Expected input parameters:
-        {chr(10).join(f'        {doc}' for doc in arg_docs)}
-    
-    Args:
-        input_data: JSON string containing the input parameters
-    
-    Returns:
-        {output_spec.get('description', 'Tool output')}
-    """
-    # NO BUSINESS LOGIC - just calls Tier-2
-    import json
-    
-    deps = get_dependency_container()
-    
-    # Parse JSON string and create Pydantic model instance
-    input_dict = json.loads(input_data)
-    input_model = {input_model_name}(**input_dict)
-    
-    result = deps.{dep_name}.{method_name}(input_model)
-    # Convert Pydantic model to dict for LangChain compatibility
-    return result.model_dump()
-'''
+    # Render the whole tool file in one pass
+    content = _TOOL_TEMPLATE.substitute(
+        tool_name=tool_name,
+        input_model_name=input_model_name,
+        purpose=purpose,
+        arg_docs='\n'.join(f'        {doc}' for doc in arg_docs),
+        output_description=output_spec.get('description', 'Tool output'),
+        dep_name=dep_name,
+        method_name=method_name,
+    )
     
     # Write the file
-    output_file = gen_dir / f"{tool_name}_gen.py"
-    with open(output_file, 'w') as f:
-        f.write(content)
+    (gen_dir / f"{tool_name}_gen.py").write_text(content)
 
 
 def generate_init_file(tool_names, gen_dir: Path):
@@ -153,95 +179,91 @@ def generate_init_file(tool_names, gen_dir: Path):
         f.write(content)
 
 
-def generate_register_tools(tool_names, gen_dir: Path):
-    """Generate register_tools.py"""
+def generate_register_tools(tools: Dict[str, Dict[str, Any]], gen_dir: Path, schemas=None):
+    """Generate register_tools.py with registrations and input schemas baked in"""
     content = '''"""
 GENERATED – DO NOT EDIT
 
 Tier-3 tool registration for Anki LLM Assistant.
 This file registers decorated tools with the tool registry.
+Tools and their input schemas are resolved from Tier-1 at generation time,
+so no spec files are read at runtime.
 """
 
-import yaml
-from pathlib import Path
 '''
     
     # Import statements
-    for tool_name in tool_names:
+    for tool_name in tools:
         content += f"from .{tool_name}_gen import {tool_name}\n"
     
+    content += "\n# Input schemas inlined from specs/schemas\n"
+    for tool_name, tool_spec in tools.items():
+        input_schema = _lookup_schema(tool_spec.get('input', {}).get('schema'), schemas)
+        schema_literal = pformat(input_schema, sort_dicts=False, width=88)
+        content += f"{_schema_constant_name(tool_name)} = {schema_literal}\n"
+    
     content += '''
 
 def register_generated_tools(registry):
     """Register all Tier-3 decorated tools with the registry"""
-
-    # Load tool specifications from Tier-1
-    project_root = Path(__file__).parent.parent.parent.parent
-    tools_spec_path = project_root / "specs" / "tools.yaml"
-
-    if not tools_spec_path.exists():
-        print(f"⚠️  Tools specification not found: {tools_spec_path}")
-        return
-
-    with open(tools_spec_path, 'r') as f:
-        tools_spec = yaml.safe_load(f)
-
-    # Tool mapping: name -> function
-    tools = {
 '''
     
-    # Tool mapping
-    for tool_name in tool_names:
-        content += f'        "{tool_name}": {tool_name},\n'
-    
-    content += '''    }
-
-    # Register only tools specified in Tier-1
-    available_tools = tools_spec.get('tools', {}).keys()
-    for name, func in tools.items():
-        if name in available_tools:
-            registry.register_tool(
-                name=name,
-                tool_func=func,
-                schema=None  # Schema validation handled by Pydantic models
-            )
-'''
+    # Unrolled registrations
+    for tool_name in tools:
+        content += (
+            f'    registry.register_tool("{tool_name}", {tool_name}, '
+            f'schema={_schema_constant_name(tool_name)})\n'
+        )
     
     with open(gen_dir / "register_tools.py", 'w') as f:
         f.write(content)
 
 
+def _schema_constant_name(tool_name: str) -> str:
+    """Module-level constant name for a tool's inlined input schema"""
+    return f"_{tool_name.upper()}_SCHEMA"
+
+
+def _lookup_schema(schema_name: str, schemas=None) -> Dict[str, Any]:
+    """Take a schema from the preloaded mapping when present, else load it from disk"""
+    if schemas is not None and schema_name in schemas:
+        return schemas[schema_name]
+    return load_schema(schema_name)
+
+
+@lru_cache(maxsize=None)
 def load_schema(schema_name: str) -> Dict[str, Any]:
-    """Load a schema file by name"""
+    """Load a schema file by name (cached per process)"""
+    schema_file = _SCHEMAS_DIR / f'{schema_name}.schema.yaml'
     try:
-        schema_file = Path(__file__).parent.parent.parent / 'specs' / 'schemas' / f'{schema_name}.schema.yaml'
-        if not schema_file.exists():
-            print(f"⚠️  Schema file not found: {schema_file}")
-            return None
-            
-        with open(schema_file, 'r') as f:
-            schema = yaml.safe_load(f)
+        with open(schema_file, 'rb') as f:
+            schema = yaml.load(f, Loader=_YAML_LOADER)
             if not schema or 'properties' not in schema:
                 print(f"⚠️  Invalid schema file {schema_name}: missing properties")
                 return None
             return schema
+    except FileNotFoundError:
+        print(f"⚠️  Schema file not found: {schema_file}")
+        return None
     except Exception as e:
         print(f"❌ Error loading schema {schema_name}: {e}")
         return None
 
 
+# JSON Schema type -> Python type annotation
+_PYTHON_TYPES = {
+    'string': 'str',
+    'integer': 'int',
+    'number': 'float',
+    'boolean': 'bool',
+    'array': 'list',
+    'object': 'dict',
+}
+
+
 def _get_python_type_from_schema(param_spec: Dict[str, Any]) -> str:
     """Convert JSON Schema type to Python type annotation"""
-    schema_type = param_spec.get('type', 'string')
-    type_mapping = {
-        'string': 'str',
-        'integer': 'int',
-        'number': 'float',
-        'boolean': 'bool',
-        'array': 'list',
-        'object': 'dict',
-    }
-    return type_mapping.get(schema_type, 'Any')
+    return _PYTHON_TYPES.get(param_spec.get('type', 'string'), 'Any')
 
 
 
@@ -1,57 +1,90 @@
+import os
+
 from invoke import task
 
+# pytest-xdist sharding: leave a couple of cores free for the editor/agent.
+# loadgroup keeps xdist_group-marked tests together and spreads the rest freely.
+_XDIST_ARGS = f"-n {max((os.cpu_count() or 1) - 2, 1)} --dist=loadgroup"
+
+# Quiet, captured, sharded runs by default; set TEST_VERBOSE=1 for per-test lines and
+# prints. xdist workers don't forward stdout, so verbose runs stay in a single process.
+if os.getenv("TEST_VERBOSE"):
+    _RUN_ARGS = "-v -s -n 0"
+else:
+    _RUN_ARGS = f"-q {_XDIST_ARGS}"
+
+
+def _cli(ctx, args):
+    """Run the application CLI with the given arguments"""
+    ctx.run(f"python -m src.app.cli {args}")
+
+
+def _pytest(ctx, target, args="", env=None):
+    """Run pytest on a target, sharded across xdist workers unless TEST_VERBOSE is set"""
+    ctx.run(f"python -m pytest {target} {args} {_RUN_ARGS}", env=env)
+
+
+@task(help={
+    "full": "Run the whole golden suite (default: last failures first, stop at first failure)",
+    "cached": "Replay verified answers from .llm_cache instead of calling the LLM",
+})
+def test_golden(ctx, full=False, cached=False):
+    """Run golden tests (TEST_VERBOSE=1 for verbose output and print statements)"""
+    # Fast loop by default: re-run last failures first (all tests if none failed)
+    _pytest(ctx, "tests/test_golden.py", "" if full else "--lf --ff -x", env={"LLM_CACHE": "1"} if cached else None)
+
 
 @task
-def test_golden(ctx):
-    """Run golden tests with verbose output and showing print statements"""
-    ctx.run(f"python -m pytest tests/test_golden.py -v -s")
+def test_golden_fresh(ctx):
+    """Run the whole golden suite against the live LLM, even if LLM_CACHE=1 is exported"""
+    _pytest(ctx, "tests/test_golden.py", env={"LLM_CACHE": "0"})
 
 @task
 def cli_help(ctx):
     """Show CLI help"""
-    ctx.run("python -m src.app.cli --help")
+    _cli(ctx, "--help")
 
 
 @task
 def cli_chat_help(ctx):
     """Show chat command help"""
-    ctx.run("python -m src.app.cli chat --help")
+    _cli(ctx, "chat --help")
 
 
 @task
 def cli_test_mock(ctx):
     """Run CLI test queries with mock mode"""
-    ctx.run("python -m src.app.cli --mode mock test")
+    _cli(ctx, "--mode mock test")
 
 
 @task
 def cli_test_anki_connect(ctx):
     """Run CLI test queries with anki_connect mode"""
-    ctx.run("python -m src.app.cli --mode anki_connect test")
+    _cli(ctx, "--mode anki_connect test")
 
 
 @task
 def cli_test_service_mock(ctx):
     """Test Anki service with mock mode"""
-    ctx.run("python -m src.app.cli --mode mock test-service")
+    _cli(ctx, "--mode mock test-service")
 
 
 @task
 def cli_test_service_anki_connect(ctx):
     """Test Anki service with anki_connect mode"""
-    ctx.run("python -m src.app.cli --mode anki_connect test-service")
+    _cli(ctx, "--mode anki_connect test-service")
 
 
 @task
 def cli_chat_mock(ctx):
     """Start interactive chat with mock mode"""
-    ctx.run("python -m src.app.cli --mode mock chat")
+    _cli(ctx, "--mode mock chat")
 
 
 @task
 def cli_chat_anki_connect(ctx):
     """Start interactive chat with anki_connect mode"""
-    ctx.run("python -m src.app.cli --mode anki_connect chat")
+    _cli(ctx, "--mode anki_connect chat")
 
 @task
 def generate_models(ctx):
@@ -67,25 +100,32 @@ def generate_tools(ctx):
 @task
 def generate_and_test(ctx):
     """Generate models and tools, then run tests to verify they work"""
-    ctx.run("python src/scripts/schema_generator.py")
-    ctx.run("python src/scripts/tool_generator.py")
-    ctx.run("python -m pytest tests/ -v")
+    # Both generators in one interpreter, sharing a single schema parse
+    ctx.run("python src/scripts/generate_all.py")
+    compile_cache(ctx)
+    _pytest(ctx, "tests/")
+
+
+@task
+def compile_cache(ctx):
+    """Precompile bytecode so xdist workers don't race to write __pycache__"""
+    ctx.run("python -m compileall -q -j 0 src")
 
 
 @task
 def cli_all_tests(ctx):
     """Run all CLI tests (mock and anki_connect modes)"""
     print("Testing CLI with mock mode...")
-    ctx.run("python -m src.app.cli --mode mock test")
+    _cli(ctx, "--mode mock test")
     print("\n" + "="*50 + "\n")
     print("Testing CLI with anki_connect mode...")
-    ctx.run("python -m src.app.cli --mode anki_connect test")
+    _cli(ctx, "--mode anki_connect test")
 
 
 @task
 def cli_version(ctx):
     """Show CLI version"""
-    ctx.run("python -m src.app.cli --version")
+    _cli(ctx, "--version")
 
 
 @task
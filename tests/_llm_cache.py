@@ -0,0 +1,48 @@
+"""
+Disk cache for golden-test agent outputs.
+
+Golden runs use temperature=0, so an answer is reproducible for a given model,
+prompt and tool set. Outputs that matched their golden file are stored in
+.llm_cache/ and replayed on later runs. The key covers the model, a fingerprint
+of the system prompt, tool schemas and Tier-2/tool sources, and the user input.
+Changing any of these therefore calls the LLM again. A replayed answer does not
+exercise the agent, so the cache is off unless LLM_CACHE=1 is set (see
+`invoke test-golden --cached`).
+"""
+
+import hashlib
+import os
+import pathlib
+
+_CACHE_DIR = pathlib.Path(__file__).resolve().parents[1] / ".llm_cache"
+
+
+def _enabled() -> bool:
+    return os.getenv("LLM_CACHE", "0") == "1"
+
+
+def cache_key(model_name: str, agent_fingerprint: str, user_input: str) -> str:
+    """Key for one golden prompt against one agent configuration"""
+    return hashlib.sha256(f"{model_name}|{agent_fingerprint}|{user_input}".encode()).hexdigest()
+
+
+def load_output(key: str) -> str | None:
+    """Return a stored agent output, or None on a miss or when the cache is disabled"""
+    if not _enabled():
+        return None
+    try:
+        return (_CACHE_DIR / f"{key}.txt").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def store_output(key: str, output: str):
+    """Store an agent output; callers only store outputs verified against the golden file"""
+    if not _enabled():
+        return
+    _CACHE_DIR.mkdir(exist_ok=True)
+    cache_file = _CACHE_DIR / f"{key}.txt"
+    # Write then rename so a concurrent xdist worker never reads a partial entry
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(output, encoding="utf-8")
+    os.replace(tmp_file, cache_file)
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import pathlib
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env():
+    """Load environment variables from .env once per session"""
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+
+
+@pytest.fixture(scope="session")
+def model_name():
+    """Model used by the golden tests"""
+    # Get model name from environment variable, fallback to a default
+    return os.getenv("OPENAI_MODEL_ENV", "gpt-4o-mini")
+
+
+@pytest.fixture(scope="session")
+def agent(model_name):
+    """Agent built once per session (once per xdist worker) and shared by every test"""
+    # Imported here so test modules that never build an agent skip LangChain/OpenAI
+    from src.app.agent_factory_gen import create_anki_agent
+    
+    # Build agent using new tiered architecture
+    return create_anki_agent(model_name=model_name, temperature=0)
+
+
+def _source_digest(*dirs):
+    """sha256 over the Python sources under the given repo-relative directories"""
+    root = pathlib.Path(__file__).resolve().parents[1]
+    digest = hashlib.sha256()
+    for path in sorted(p for d in dirs for p in (root / d).rglob("*.py")):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@pytest.fixture(scope="session")
+def agent_fingerprint():
+    """Hash of the agent's system prompt, tool schemas and Tier-2/tool sources (no LLM needed)"""
+    from src.core.agent.agent_factory import AgentFactory
+    
+    factory = AgentFactory()
+    builder = factory.agent_builder
+    prompt = builder._build_prompt(builder._build_system_rules())
+    registry = factory.tool_registry
+    payload = {
+        "prompt": [message.prompt.template for message in prompt.messages],
+        "tools": [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "schema": registry.get_tool_schema(tool.name),
+            }
+            for tool in registry.get_tools()
+        ],
+        # Services, mock data and tool wrappers shape the answer too; edits there must miss the cache
+        "sources": _source_digest("src/core", "src/app/tools"),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def deps():
+    """Shared dependency container"""
+    from src.core.dependencies import get_dependency_container
+    
+    return get_dependency_container()
+
+
+@pytest.fixture(scope="module")
+def mock_service():
+    """MockAnkiService shared by the tests of one module (it holds no state)"""
+    from src.core.services.anki_service import MockAnkiService
+    
+    return MockAnkiService()
+
+
+@pytest.fixture(scope="module")
+def anki_connect_service():
+    """AnkiConnectService on the default URL, shared by the tests of one module"""
+    from src.core.services.anki_service import AnkiConnectService
+    
+    return AnkiConnectService()
@@ -0,0 +1,42 @@
+"""
+Tests for the generated Tier-3 tool wrappers.
+
+This file checks that the wrappers delegate to the current dependency
+container's Tier-2 tools.
+"""
+
+from src.app.tools import anki_list_decks
+from src.core.dependencies import DependencyContainer, get_dependency_container
+from src.core.generated.models import DeckList
+
+
+class TestGeneratedTools:
+    """Test the generated tool wrappers"""
+    
+    def test_tool_follows_container_reset(self, monkeypatch):
+        """Test that a tool uses the new container after cache_clear()"""
+        class FakeDecksTool:
+            def list_decks(self, input_model):
+                return DeckList.model_construct(kind="deck_list", decks=[])
+        
+        # The first call builds a container against the mock service
+        monkeypatch.setenv("ANKI_MODE", "mock")
+        get_dependency_container.cache_clear()
+        try:
+            anki_list_decks.invoke({"input_data": '{"limit": 1}'})
+            old_container = get_dependency_container()
+            get_dependency_container.cache_clear()
+            
+            containers_used = []
+            monkeypatch.setattr(
+                DependencyContainer,
+                "decks_tool",
+                property(lambda self: containers_used.append(self) or FakeDecksTool()),
+            )
+            output = anki_list_decks.invoke({"input_data": '{"limit": 1}'})
+            
+            assert output == '{"kind":"deck_list","decks":[]}'
+            assert containers_used == [get_dependency_container()]
+            assert containers_used[0] is not old_container
+        finally:
+            get_dependency_container.cache_clear()
@@ -0,0 +1,27 @@
+"""
+Tests for the input validator.
+
+This file checks limit coercion and range validation.
+"""
+
+import pytest
+
+from src.core.validators.input_validator import InputValidator
+
+
+class TestValidateDeckLimit:
+    """Test InputValidator.validate_deck_limit"""
+    
+    def test_int_in_range_is_returned(self):
+        """Test that an in-range int passes through unchanged"""
+        assert InputValidator().validate_deck_limit(10) == 10
+    
+    def test_string_is_converted(self):
+        """Test that a numeric string is converted to int"""
+        assert InputValidator().validate_deck_limit("5") == 5
+    
+    @pytest.mark.parametrize("limit", [0, 101, "0", 100.9])
+    def test_out_of_range_is_rejected(self, limit):
+        """Test that out-of-range limits raise, and floats are not truncated into range"""
+        with pytest.raises(ValueError):
+            InputValidator().validate_deck_limit(limit)
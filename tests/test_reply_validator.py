@@ -0,0 +1,61 @@
+"""
+Tests for reply payload validation.
+
+This file tests that validate_reply dispatches on the message kind
+and rejects payloads that do not match any contract.
+"""
+
+import pytest
+
+from src.core.contracts import validate_reply
+from src.core.generated.models import CardList, DeckList
+
+
+class TestValidateReply:
+    """Test validation of agent reply payloads"""
+    
+    def test_deck_list_payload(self):
+        """Test that a deck_list payload validates to a DeckList"""
+        reply = validate_reply({
+            "kind": "deck_list",
+            "decks": [{"name": "French::A1", "note_count": 312}]
+        })
+        
+        assert isinstance(reply, DeckList)
+        assert reply.decks[0].name == "French::A1"
+    
+    def test_card_list_payload(self):
+        """Test that a card_list payload validates to a CardList"""
+        reply = validate_reply({
+            "kind": "card_list",
+            "deck": "French::A1",
+            "cards": [{"id": 1, "question": "Q", "answer": "A", "deck": "French::A1"}],
+            "total_count": 1,
+            "limit_applied": 1,
+            "has_more": False
+        })
+        
+        assert isinstance(reply, CardList)
+        assert reply.cards[0].id == 1
+    
+    def test_raw_json_payload(self):
+        """Test that a raw JSON string is parsed and validated directly"""
+        reply = validate_reply('{"kind": "deck_list", "decks": []}')
+        
+        assert isinstance(reply, DeckList)
+        assert reply.decks == []
+    
+    def test_invalid_json_raises(self):
+        """Test that malformed JSON is rejected"""
+        with pytest.raises(ValueError):
+            validate_reply(b'{"kind": "deck_list", ')
+    
+    def test_unknown_kind_raises(self):
+        """Test that an unknown message kind is rejected"""
+        with pytest.raises(ValueError):
+            validate_reply({"kind": "note_list"})
+    
+    def test_invalid_payload_raises(self):
+        """Test that a payload missing required fields is rejected"""
+        with pytest.raises(ValueError):
+            validate_reply({"kind": "deck_list"})
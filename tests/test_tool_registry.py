@@ -0,0 +1,43 @@
+"""
+Tests for the tool registry.
+
+This file checks that generated tools register with their input schemas
+and that the registry validates those schemas.
+"""
+
+import pytest
+
+from src.core.tools import register_all_tools
+from src.core.tools.tool_registry import ToolRegistry
+
+
+class TestToolRegistry:
+    """Test tool registration and schema validation"""
+    
+    def test_generated_tools_pass_validation(self):
+        """Test that every generated tool's inlined schema validates"""
+        registry = ToolRegistry()
+        register_all_tools(registry)
+        
+        registry.validate_tool_config()
+        assert registry.get_tool_schema("anki_list_cards")["required"] == ["deck", "limit"]
+    
+    def test_tool_without_schema_is_skipped(self):
+        """Test that tools registered without a schema are not validated"""
+        registry = ToolRegistry()
+        registry.register_tool("no_schema", lambda: None)
+        
+        registry.validate_tool_config()
+        assert registry.get_tool_schema("no_schema") is None
+    
+    def test_required_field_missing_from_properties_is_rejected(self):
+        """Test that a schema requiring an undeclared field fails validation"""
+        registry = ToolRegistry()
+        registry.register_tool("broken", lambda: None, schema={
+            "type": "object",
+            "properties": {"limit": {"type": "integer"}},
+            "required": ["deck", "limit"],
+        })
+        
+        with pytest.raises(ValueError, match="deck"):
+            registry.validate_tool_config()